@@ -2,7 +2,6 @@
 from typing import List, Tuple, Union
 
 from einops import rearrange
-from numpy import prod
 from torch import Tensor, einsum
 from torch.nn import ConvTranspose1d, ConvTranspose2d, ConvTranspose3d, Module
 
@@ -106,13 +105,14 @@ class ConvTransposeNDDerivatives(BaseParameterDerivatives):
         return einsum(equation, u, mat_reshape).reshape(final_shape)
 
     def ea_jac_t_mat_jac_prod(self, module, g_inp, g_out, mat):
-        in_features = int(prod(module.input0.size()[1:]))
-        out_features = int(prod(module.output.size()[1:]))
+        in_features = module.input0.shape[1:].numel()
+        out_features_shape = module.output.shape[1:]
+        out_features = out_features_shape.numel()
 
-        mat = mat.reshape(out_features, *module.output.size()[1:])
+        mat = mat.reshape(out_features, *out_features_shape)
         jac_t_mat = self.__jac_t(module, mat).reshape(out_features, in_features)
 
-        mat_t_jac = jac_t_mat.t().reshape(in_features, *module.output.size()[1:])
+        mat_t_jac = jac_t_mat.t().reshape(in_features, *out_features_shape)
         jac_t_mat_t_jac = self.__jac_t(module, mat_t_jac)
         jac_t_mat_t_jac = jac_t_mat_t_jac.reshape(in_features, in_features)
 
@@ -2,7 +2,6 @@ from typing import List, Tuple, Union
 from warnings import warn
 
 from einops import rearrange, reduce
-from numpy import prod
 from torch import Tensor, einsum
 from torch.nn import Conv1d, Conv2d, Conv3d, Module
 
@@ -264,13 +263,14 @@ class ConvNDDerivatives(BaseParameterDerivatives):
         return weight_grad
 
     def ea_jac_t_mat_jac_prod(self, module, g_inp, g_out, mat):
-        in_features = int(prod(module.input0.size()[1:]))
-        out_features = int(prod(module.output.size()[1:]))
+        in_features = module.input0.shape[1:].numel()
+        out_features_shape = module.output.shape[1:]
+        out_features = out_features_shape.numel()
 
-        mat = mat.reshape(out_features, *module.output.size()[1:])
+        mat = mat.reshape(out_features, *out_features_shape)
         jac_t_mat = self.__jac_t(module, mat).reshape(out_features, in_features)
 
-        mat_t_jac = jac_t_mat.t().reshape(in_features, *module.output.size()[1:])
+        mat_t_jac = jac_t_mat.t().reshape(in_features, *out_features_shape)
         jac_t_mat_t_jac = self.__jac_t(module, mat_t_jac)
         jac_t_mat_t_jac = jac_t_mat_t_jac.reshape(in_features, in_features)
 
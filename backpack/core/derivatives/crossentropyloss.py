@@ -267,7 +267,7 @@ class CrossEntropyLossDerivatives(NLLLossDerivatives):
             Normal distribution for targets | inputs
         """
         probs = softmax(subsampled_input, dim=1)
-        probs_rearranged = einsum("nc...->n...c", probs)
+        probs_rearranged = probs.movedim(1, -1)
         return Categorical(probs_rearranged)
 
     def _compute_sampled_grads_manual(
@@ -292,7 +292,7 @@ class CrossEntropyLossDerivatives(NLLLossDerivatives):
         distribution = self._make_distribution(subsampled_input)
         samples = distribution.sample(Size([mc_samples]))  # [V N D1 D2]
         samples_onehot = one_hot(samples, num_classes=probs.shape[1])  # [V N D1 D2 C]
-        samples_onehot_rearranged = einsum("vn...c->vnc...", samples_onehot).to(
+        samples_onehot_rearranged = samples_onehot.movedim(-1, 2).to(
             probs.dtype
         )  # [V N C D1 D2]
 
@@ -96,7 +96,7 @@ def check_like_with_sum_batch(mat, module, name, sum_batch=True, *args, **kwargs
 
 
 def _same_dim_as(mat, module, name, *args, **kwargs):
-    return len(mat.shape) == len(getattr(module, name).shape)
+    return mat.dim() == getattr(module, name).dim()
 
 
 ###############################################################################
@@ -54,6 +54,32 @@ from . import (
     slicing,
 )
 
+# Module extensions shared by ``DiagHessian`` and ``BatchDiagHessian``. They are
+# stateless, hence built once at import and reused by all extension instances.
+_DIAG_H_MODULE_EXTS = {
+    MSELoss: losses.DiagHMSELoss(),
+    CrossEntropyLoss: losses.DiagHCrossEntropyLoss(),
+    MaxPool1d: pooling.DiagHMaxPool1d(),
+    MaxPool2d: pooling.DiagHMaxPool2d(),
+    AvgPool1d: pooling.DiagHAvgPool1d(),
+    MaxPool3d: pooling.DiagHMaxPool3d(),
+    AvgPool2d: pooling.DiagHAvgPool2d(),
+    AvgPool3d: pooling.DiagHAvgPool3d(),
+    ZeroPad2d: padding.DiagHZeroPad2d(),
+    Dropout: dropout.DiagHDropout(),
+    Flatten: flatten.DiagHFlatten(),
+    ReLU: activations.DiagHReLU(),
+    Sigmoid: activations.DiagHSigmoid(),
+    Tanh: activations.DiagHTanh(),
+    LeakyReLU: activations.DiagHLeakyReLU(),
+    LogSigmoid: activations.DiagHLogSigmoid(),
+    ELU: activations.DiagHELU(),
+    SELU: activations.DiagHSELU(),
+    Pad: pad.DiagHPad(),
+    Slicing: slicing.DiagHSlicing(),
+    BCEWithLogitsLoss: losses.DiagHBCEWithLogitsLoss(),
+}
+
 
 class DiagHessian(SecondOrderBackpropExtension):
     """BackPACK extension that computes the Hessian diagonal.
@@ -72,34 +98,14 @@ class DiagHessian(SecondOrderBackpropExtension):
             savefield="diag_h",
             fail_mode="ERROR",
             module_exts={
-                MSELoss: losses.DiagHMSELoss(),
-                CrossEntropyLoss: losses.DiagHCrossEntropyLoss(),
+                **_DIAG_H_MODULE_EXTS,
                 Linear: linear.DiagHLinear(),
-                MaxPool1d: pooling.DiagHMaxPool1d(),
-                MaxPool2d: pooling.DiagHMaxPool2d(),
-                AvgPool1d: pooling.DiagHAvgPool1d(),
-                MaxPool3d: pooling.DiagHMaxPool3d(),
-                AvgPool2d: pooling.DiagHAvgPool2d(),
-                AvgPool3d: pooling.DiagHAvgPool3d(),
-                ZeroPad2d: padding.DiagHZeroPad2d(),
                 Conv1d: conv1d.DiagHConv1d(),
                 Conv2d: conv2d.DiagHConv2d(),
                 Conv3d: conv3d.DiagHConv3d(),
                 ConvTranspose1d: convtranspose1d.DiagHConvTranspose1d(),
                 ConvTranspose2d: convtranspose2d.DiagHConvTranspose2d(),
                 ConvTranspose3d: convtranspose3d.DiagHConvTranspose3d(),
-                Dropout: dropout.DiagHDropout(),
-                Flatten: flatten.DiagHFlatten(),
-                ReLU: activations.DiagHReLU(),
-                Sigmoid: activations.DiagHSigmoid(),
-                Tanh: activations.DiagHTanh(),
-                LeakyReLU: activations.DiagHLeakyReLU(),
-                LogSigmoid: activations.DiagHLogSigmoid(),
-                ELU: activations.DiagHELU(),
-                SELU: activations.DiagHSELU(),
-                Pad: pad.DiagHPad(),
-                Slicing: slicing.DiagHSlicing(),
-                BCEWithLogitsLoss: losses.DiagHBCEWithLogitsLoss(),
             },
         )
 
@@ -122,33 +128,13 @@ class BatchDiagHessian(SecondOrderBackpropExtension):
             savefield="diag_h_batch",
             fail_mode="ERROR",
             module_exts={
-                MSELoss: losses.DiagHMSELoss(),
-                CrossEntropyLoss: losses.DiagHCrossEntropyLoss(),
+                **_DIAG_H_MODULE_EXTS,
                 Linear: linear.BatchDiagHLinear(),
-                MaxPool1d: pooling.DiagHMaxPool1d(),
-                MaxPool2d: pooling.DiagHMaxPool2d(),
-                AvgPool1d: pooling.DiagHAvgPool1d(),
-                MaxPool3d: pooling.DiagHMaxPool3d(),
-                AvgPool2d: pooling.DiagHAvgPool2d(),
-                AvgPool3d: pooling.DiagHAvgPool3d(),
-                ZeroPad2d: padding.DiagHZeroPad2d(),
                 Conv1d: conv1d.BatchDiagHConv1d(),
                 Conv2d: conv2d.BatchDiagHConv2d(),
                 Conv3d: conv3d.BatchDiagHConv3d(),
                 ConvTranspose1d: convtranspose1d.BatchDiagHConvTranspose1d(),
                 ConvTranspose2d: convtranspose2d.BatchDiagHConvTranspose2d(),
                 ConvTranspose3d: convtranspose3d.BatchDiagHConvTranspose3d(),
-                Dropout: dropout.DiagHDropout(),
-                Flatten: flatten.DiagHFlatten(),
-                ReLU: activations.DiagHReLU(),
-                Sigmoid: activations.DiagHSigmoid(),
-                Tanh: activations.DiagHTanh(),
-                LeakyReLU: activations.DiagHLeakyReLU(),
-                LogSigmoid: activations.DiagHLogSigmoid(),
-                ELU: activations.DiagHELU(),
-                SELU: activations.DiagHSELU(),
-                Pad: pad.DiagHPad(),
-                Slicing: slicing.DiagHSlicing(),
-                BCEWithLogitsLoss: losses.DiagHBCEWithLogitsLoss(),
             },
         )
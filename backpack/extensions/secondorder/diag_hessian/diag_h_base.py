@@ -1,5 +1,4 @@
-from numpy import prod
-from torch import clamp, diag_embed, einsum
+from torch import clamp, diag_embed
 
 from backpack.extensions.mat_to_mat_jac_base import MatToJacMat
 
@@ -37,12 +36,12 @@ class DiagHBaseModule(MatToJacMat):
             embed into [N, C_in * H_in * ..., C_in * H_in = V], convert back
             to [V, N, C_in, H_in, ...,  V]."""
             feature_shapes = H.shape[1:]
-            V, N = prod(feature_shapes), H.shape[0]
+            V, N = feature_shapes.numel(), H.shape[0]
 
             H_diag = diag_embed(H.view(N, V))
             # [V, N, C_in, H_in, ...]
             shape = (V, N, *feature_shapes)
-            return einsum("nic->cni", H_diag).view(shape)
+            return H_diag.permute(2, 0, 1).view(shape)
 
         def decompose_into_positive_and_negative_sqrt(H):
             return [
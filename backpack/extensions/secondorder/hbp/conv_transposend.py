@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Tuple, Union
 from warnings import warn
 
-from torch import Tensor, einsum
+from torch import Tensor
 from torch.nn import ConvTranspose1d, ConvTranspose2d, ConvTranspose3d
 
 from backpack.core.derivatives.conv_transpose1d import ConvTranspose1DDerivatives
@@ -129,8 +129,11 @@ class HBPConvTransposeNd(HBPBaseModule):
             raise NotImplementedError("Undefined")
 
         X = unfold_by_conv_transpose(module.input0, module)
+        batch_size = X.shape[0]
+        # merge batch and patch axes to compute Σ_{b,k} X[b,i,k] X[b,j,k] as one GEMM
+        X = X.transpose(0, 1).flatten(start_dim=1)
 
-        return [einsum("bik,bjk->ij", X, X) / X.shape[0]]
+        return [(X @ X.T).div_(batch_size)]
 
     def _factor_from_sqrt(
         self,
@@ -160,9 +163,10 @@ class HBPConvTransposeNd(HBPBaseModule):
         Returns:
             MC/exact GGN w.r.t. the bias. Has shape `[C_out, C_out]`
         """
-        sqrt_ggn = backproped.flatten(start_dim=-self._conv_dim)
-        sqrt_ggn = einsum("cbij->cbi", sqrt_ggn)
-        return einsum("cbi,cbl->il", sqrt_ggn, sqrt_ggn)
+        # sum over spatial coordinates, then merge MC sample/class and batch axes
+        sqrt_ggn = backproped.flatten(start_dim=-self._conv_dim).sum(-1)
+        sqrt_ggn = sqrt_ggn.flatten(end_dim=1)
+        return sqrt_ggn.T @ sqrt_ggn
 
     def bias(
         self,
@@ -231,8 +235,9 @@ class HBPConvTransposeNd(HBPBaseModule):
             convolutions. Has shape `[C, C]` with `C` the transpose convolution's output
             channels.
         """
-        spatial_dim = module.output.shape[-self._conv_dim :].numel()
-        out_channels = module.output.shape[-self._conv_dim - 1]
+        output_shape = module.output.shape
+        spatial_dim = output_shape[-self._conv_dim :].numel()
+        out_channels = output_shape[-self._conv_dim - 1]
 
         # sum over spatial coordinates
         return backproped.reshape(
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Tuple, Union
 
-from torch import Tensor, einsum
+from torch import Tensor
 from torch.nn import Conv1d, Conv2d, Conv3d
 
 from backpack.core.derivatives.conv1d import Conv1DDerivatives
@@ -118,8 +118,11 @@ class HBPConvNd(HBPBaseModule):
             raise NotImplementedError("Undefined")
 
         X = convUtils.unfold_input(module, module.input0)
+        batch_size = X.shape[0]
+        # merge batch and patch axes to compute Σ_{b,k} X[b,i,k] X[b,j,k] as one GEMM
+        X = X.transpose(0, 1).flatten(start_dim=1)
 
-        return [einsum("bik,bjk->ij", X, X) / X.shape[0]]
+        return [(X @ X.T).div_(batch_size)]
 
     def _factor_from_sqrt(
         self, module: Union[Conv1d, Conv2d, Conv3d], backproped: Tensor
@@ -147,9 +150,10 @@ class HBPConvNd(HBPBaseModule):
         Returns:
             MC/exact GGN w.r.t. the bias. Has shape `[C_out, C_out]`
         """
-        sqrt_ggn = backproped.flatten(start_dim=-self._conv_dim)
-        sqrt_ggn = einsum("cbij->cbi", sqrt_ggn)
-        return einsum("cbi,cbl->il", sqrt_ggn, sqrt_ggn)
+        # sum over spatial coordinates, then merge MC sample/class and batch axes
+        sqrt_ggn = backproped.flatten(start_dim=-self._conv_dim).sum(-1)
+        sqrt_ggn = sqrt_ggn.flatten(end_dim=1)
+        return sqrt_ggn.T @ sqrt_ggn
 
     def bias(
         self,
@@ -215,8 +219,9 @@ class HBPConvNd(HBPBaseModule):
             Kronecker factor used for approximating the weight Hessian in convolutions.
             Has shape `[C, C]` with `C` the convolution's output channels.
         """
-        spatial_dim = module.output.shape[-self._conv_dim :].numel()
-        out_channels = module.output.shape[-self._conv_dim - 1]
+        output_shape = module.output.shape
+        spatial_dim = output_shape[-self._conv_dim :].numel()
+        out_channels = output_shape[-self._conv_dim - 1]
 
         # sum over spatial coordinates
         return (
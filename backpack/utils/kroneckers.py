@@ -1,8 +1,15 @@
-from torch import einsum
+from functools import lru_cache
+from string import ascii_lowercase
+
+from torch import einsum, kron, tensordot
 from torch.linalg import eigh
 
 from backpack.utils.unsqueeze import kfacmp_unsqueeze_if_missing_dim
 
+# Kronecker-matrix products with at most this many factors are contracted one
+# factor at a time, larger ones by a single einsum
+MAX_FACTORS_SEQUENTIAL_KFAC_MAT_PROD = 4
+
 
 def kfacs_to_mat(factors):
     """Given [A, B, C, ...], return A ⊗ B ⊗ C ⊗ ... ."""
@@ -22,12 +29,7 @@ def two_kfacs_to_mat(A, B):
     assert is_matrix(A)
     assert is_matrix(B)
 
-    mat_shape = (
-        A.shape[0] * B.shape[0],
-        A.shape[1] * B.shape[1],
-    )
-    mat = einsum("ij,kl->ikjl", (A, B)).contiguous().view(mat_shape)
-    return mat
+    return kron(A, B)
 
 
 def kfac_mat_prod(factors):
@@ -38,18 +40,40 @@ def kfac_mat_prod(factors):
     _, col_dims = zip(*shapes)
 
     num_factors = len(shapes)
-    equation = kfac_mat_prod_einsum_equation(num_factors)
+
+    if num_factors <= MAX_FACTORS_SEQUENTIAL_KFAC_MAT_PROD:
+
+        def contract(mat_reshaped):
+            return kfac_tensor_prod_sequential(factors, mat_reshaped)
+
+    else:
+        equation = kfac_mat_prod_einsum_equation(num_factors)
+
+        def contract(mat_reshaped):
+            return einsum(equation, mat_reshaped, *factors)
 
     @kfacmp_unsqueeze_if_missing_dim(mat_dim=2)
     def kfacmp(mat):
         assert is_matrix(mat)
         _, mat_cols = mat.shape
         mat_reshaped = mat.view(*(col_dims), mat_cols)
-        return einsum(equation, mat_reshaped, *factors).contiguous().view(-1, mat_cols)
+        return contract(mat_reshaped).reshape(-1, mat_cols)
 
     return kfacmp
 
 
+def kfac_tensor_prod_sequential(factors, tensor):
+    """Return (A ⊗ B ⊗ ...) tensor for `factors = [A, B, ...]`, one factor at a time.
+
+    `tensor` has one leading axis per factor and a trailing column axis. Each step
+    contracts the current leading axis with a factor, which is a single matrix
+    product, and appends the factor's row axis at the end.
+    """
+    for factor in factors:
+        tensor = tensordot(tensor, factor, dims=([0], [1]))
+    return tensor.movedim(0, -1)
+
+
 def apply_kfac_mat_prod(factors, mat):
     """Return (A ⊗ B ⊗ ...) mat for `factors = [A, B, ...]`
 
@@ -113,30 +137,27 @@ def inv_kfacs(factors, shift=None):
     return [sym_mat_inv(mat, shift) for mat, shift in zip(factors, shifts)]
 
 
+@lru_cache(maxsize=None)
 def kfac_mat_prod_einsum_equation(num_factors):
-    letters = get_letters()
-    in_str, mat_str, out_str = "", "", ""
+    """Return einsum equation of (A ⊗ B ⊗ ...) mat for `num_factors` factors."""
+    if 2 * num_factors + 1 > len(ascii_lowercase):
+        raise ValueError(f"Too many Kronecker factors for einsum: {num_factors}")
 
-    for _ in range(num_factors):
-        row_idx, col_idx = next(letters), next(letters)
+    rows = ascii_lowercase[:num_factors]
+    cols = ascii_lowercase[num_factors : 2 * num_factors]
+    mat_col_idx = ascii_lowercase[2 * num_factors]
 
-        in_str += "," + row_idx + col_idx
-        mat_str += col_idx
-        out_str += row_idx
+    in_str = ",".join(row_idx + col_idx for row_idx, col_idx in zip(rows, cols))
 
-    mat_col_idx = next(letters)
-    mat_str += mat_col_idx
-    out_str += mat_col_idx
-
-    return "{}{}->{}".format(mat_str, in_str, out_str)
+    return f"{cols}{mat_col_idx},{in_str}->{rows}{mat_col_idx}"
 
 
 def all_tensors_of_order(order, tensors):
-    return all(is_tensor_of_order(order, t) for t in tensors)
+    return all(t.dim() == order for t in tensors)
 
 
 def is_tensor_of_order(order, tensor):
-    return len(tensor.shape) == order
+    return tensor.dim() == order
 
 
 def is_matrix(tensor):
@@ -147,8 +168,3 @@ def is_matrix(tensor):
 def is_vector(tensor):
     vector_order = 1
     return is_tensor_of_order(vector_order, tensor)
-
-
-def get_letters(max_letters=26):
-    for i in range(max_letters):
-        yield chr(ord("a") + i)
@@ -145,14 +145,22 @@ class KroneckerUtilsTest(unittest.TestCase):
         make_mat = self.make_matrix_for_multiplication_with
         self.compare_kfac_tensor_prod(make_mat)
 
-    def compare_kfac_tensor_prod(self, make_tensor):
+    def test_apply_kfac_mat_prod_many_factors(self):
+        """Check einsum-based multiplication with more Kronecker factors."""
+        num_facs = bp_utils.MAX_FACTORS_SEQUENTIAL_KFAC_MAT_PROD + 1
+        make_mat = self.make_matrix_for_multiplication_with
+        self.compare_kfac_tensor_prod(make_mat, num_facs=num_facs, runs=5)
+
+    def compare_kfac_tensor_prod(self, make_tensor, num_facs=None, runs=None):
+        runs = runs if runs is not None else self.RUNS
+
         def set_up():
-            factors = self.make_random_kfacs()
+            factors = self.make_random_kfacs(num_facs=num_facs)
             kfac = bp_utils.kfacs_to_mat(factors)
             tensor = make_tensor(kfac)
             return factors, kfac, tensor
 
-        for _ in range(self.RUNS):
+        for _ in range(runs):
             factors, kfac, tensor = set_up()
 
             bp_result = bp_utils.apply_kfac_mat_prod(factors, tensor)